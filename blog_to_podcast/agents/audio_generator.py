@@ -5,13 +5,16 @@ Agent that handles TTS synthesis and audio mixing.
 from __future__ import annotations
 
 import base64
-import io
+import hashlib
 import logging
 import os
 import shutil
+import subprocess
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
 
 import imageio_ffmpeg
 import numpy as np
@@ -25,38 +28,80 @@ from tenacity import retry, stop_after_attempt, wait_fixed
 
 logger = logging.getLogger(__name__)
 
+# The Murf SDK may use different attribute or key names for the audio payload
+# depending on version and serialization (camelCase vs snake_case).
+_AUDIO_KEYS = ("encoded_audio", "encodedAudio", "encodedAudioBase64", "encodedAudio64")
+_URL_KEYS = ("audio_file", "audioFile", "url", "audio_url", "signedUrl")
+
 # Configure ffmpeg/ffprobe for PyDub so that users do not need a global installation.
 AudioSegment.converter = imageio_ffmpeg.get_ffmpeg_exe()
 AudioSegment.ffmpeg = AudioSegment.converter
 AudioSegment.ffprobe = shutil.which("ffprobe") or AudioSegment.converter
 
 
-def _segment_to_float_array(segment: AudioSegment) -> np.ndarray:
-    array = np.array(segment.get_array_of_samples()).astype(np.float32)
-    if segment.channels > 1:
-        array = array.reshape((-1, segment.channels)).mean(axis=1)
-    max_int16 = float(np.iinfo(np.int16).max)
-    if max_int16 == 0:
-        return array
-    return array / max_int16
+@lru_cache(maxsize=4)
+def _meter(frame_rate: int) -> pyln.Meter:
+    # Meter construction precomputes BS.1770 IIR coefficients; the pipeline
+    # standardizes everything to 44.1 kHz, so this caches a single instance.
+    return pyln.Meter(frame_rate)
+
+
+# Equal-weight stereo downmix with the int16 -> [-1, 1] scale folded in, so
+# the reduction and the cast happen in one BLAS matrix-vector pass.
+_MONO_WEIGHTS = np.array([0.5 / 32767.0, 0.5 / 32767.0], dtype=np.float32)
+
+
+def _to_mono_float(pcm: np.ndarray) -> np.ndarray:
+    if pcm.ndim == 2 and pcm.shape[1] == 2:
+        return pcm.astype(np.float32).dot(_MONO_WEIGHTS)
+    return pcm.astype(np.float32).ravel() * np.float32(1.0 / 32767.0)
 
 
-def _normalize_lufs(segment: AudioSegment, target_lufs: float) -> AudioSegment:
-    array = _segment_to_float_array(segment)
-    if not np.any(array):
-        return segment
-    meter = pyln.Meter(segment.frame_rate)
-    loudness = meter.integrated_loudness(array)
-    gain = target_lufs - loudness
-    return segment.apply_gain(gain)
+def _apply_gain_inplace(pcm: np.ndarray, gain_db: float) -> None:
+    """Scale an int16 buffer in place, clipping only when amplifying."""
+    factor = 10.0 ** (gain_db / 20.0)
+    if factor <= 1.0:
+        # Attenuation cannot overflow int16, so scale without a temporary.
+        np.multiply(pcm, factor, out=pcm, casting="unsafe")
+        return
+    scaled = pcm.astype(np.float32)
+    scaled *= factor
+    np.clip(scaled, -32768.0, 32767.0, out=scaled)
+    pcm[:] = scaled.astype(np.int16)
+
+
+def _normalize_lufs_pcm(
+    pcm: np.ndarray, target_lufs: float, *, mono: Optional[np.ndarray] = None
+) -> np.ndarray:
+    if mono is None:
+        mono = _to_mono_float(pcm)
+    # A single SIMD max pass beats np.any, which materializes a boolean
+    # array the full length of the track just to test for silence.
+    if float(np.abs(mono).max(initial=0.0)) <= 1e-6:
+        return pcm
+    loudness = _meter(44100).integrated_loudness(mono)
+    factor = 10.0 ** ((target_lufs - loudness) / 20.0)
+    scaled = pcm.astype(np.float32) * factor
+    np.clip(scaled, -32768.0, 32767.0, out=scaled)
+    return scaled.astype(np.int16)
 
 
 def _standardize_segment(segment: AudioSegment) -> AudioSegment:
-    return (
-        segment.set_frame_rate(44100)
-        .set_sample_width(2)
-        .set_channels(2)
-    )
+    # Each set_* call builds a new AudioSegment and copies raw_data even when
+    # the source already matches, so skip the ones that would be no-ops.
+    if segment.frame_rate != 44100:
+        segment = segment.set_frame_rate(44100)
+    if segment.sample_width != 2:
+        segment = segment.set_sample_width(2)
+    if segment.channels != 2:
+        segment = segment.set_channels(2)
+    return segment
+
+
+def _to_pcm(segment: AudioSegment) -> np.ndarray:
+    """Return the segment's samples as an (n_frames, 2) int16 array."""
+    segment = _standardize_segment(segment)
+    return np.frombuffer(segment.raw_data, dtype=np.int16).reshape(-1, 2)
 
 
 @dataclass
@@ -74,6 +119,10 @@ class AudioGeneratorAgent:
     voice_id: str = "en-US-julia"
     murf_model: str = "GEN2"
     http_timeout: int = 30
+    # Raw 44.1 kHz stereo PCM runs ~10 MB per minute of speech, and the web
+    # deployment writes one entry per paragraph of every conversion; cap the
+    # cache so it cannot grow without bound.
+    tts_cache_max_bytes: int = 512 * 1024 * 1024
 
     def __post_init__(self) -> None:
         load_dotenv()
@@ -85,64 +134,248 @@ class AudioGeneratorAgent:
             )
         self.tts_client = Murf(api_key=api_key)
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._cache_dir = self.output_path.parent / ".tts_cache"
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        # Intro/outro are fixed assets: decode, fade, and normalize them once
+        # here so every run skips two ffmpeg spawns and two loudness passes.
+        self._intro_pcm = _normalize_lufs_pcm(
+            self._decode_to_pcm(self.intro_path, fade_in=2000),
+            self.target_lufs + self.music_delta_db,
+        )
+        self._outro_pcm = _normalize_lufs_pcm(
+            self._decode_to_pcm(self.outro_path, fade_out=1500),
+            self.target_lufs + self.music_delta_db,
+        )
         self.runnable = RunnableLambda(self._run)
 
-    def _synthesize(self, script: str) -> AudioSegment:
+    @staticmethod
+    def _ffmpeg_decode_command() -> list:
+        return [
+            AudioSegment.converter,
+            "-i",
+            "pipe:0",
+            "-f",
+            "s16le",
+            "-ar",
+            "44100",
+            "-ac",
+            "2",
+            "-loglevel",
+            "error",
+            "pipe:1",
+        ]
+
+    @staticmethod
+    def _ffmpeg_encode_command(*dest_args: str) -> list:
+        # -threads 0 lets ffmpeg size its own pool; compression_level 2
+        # trades a sliver of encoder effort for a much faster libmp3lame
+        # pass (0 = slowest/best, 9 = fastest).
+        return [
+            AudioSegment.converter,
+            "-y",
+            "-f",
+            "s16le",
+            "-ar",
+            "44100",
+            "-ac",
+            "2",
+            "-i",
+            "pipe:0",
+            "-codec:a",
+            "libmp3lame",
+            "-b:a",
+            "320k",
+            "-threads",
+            "0",
+            "-compression_level",
+            "2",
+            "-loglevel",
+            "error",
+            *dest_args,
+        ]
+
+    @staticmethod
+    def _pcm_from_raw(raw: bytes) -> np.ndarray:
+        pcm = np.frombuffer(raw, dtype=np.int16)
+        return pcm[: (len(pcm) // 2) * 2].reshape(-1, 2)
+
+    def _decode_audio_bytes(self, audio_bytes: bytes) -> np.ndarray:
+        """Decode compressed audio to 44.1 kHz stereo int16 via one ffmpeg pipe.
+
+        pydub's ``AudioSegment.from_file`` writes the payload to a temp file
+        and re-reads it; piping through ffmpeg's stdin/stdout skips the disk
+        round-trip entirely.
+        """
+        proc = subprocess.run(
+            self._ffmpeg_decode_command(),
+            input=audio_bytes,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        if proc.returncode != 0 or not proc.stdout:
+            detail = proc.stderr.decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"ffmpeg failed to decode Murf audio: {detail}")
+        return self._pcm_from_raw(proc.stdout)
+
+    def _synthesize_streaming(self, script: str) -> Optional[np.ndarray]:
+        """Stream Murf chunks straight into the ffmpeg decoder as they arrive.
+
+        Returns None when the installed Murf SDK has no streaming endpoint,
+        so the caller can fall back to the batch request.
+        """
+        stream = getattr(self.tts_client.text_to_speech, "stream", None)
+        if stream is None:
+            return None
+        proc = subprocess.Popen(
+            self._ffmpeg_decode_command(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        feed_errors: list = []
+
+        def _feed() -> None:
+            try:
+                for chunk in stream(
+                    text=script,
+                    voice_id=self.voice_id,
+                    format="WAV",
+                    sample_rate=44100,
+                    # Unlike generate(), the stream endpoint names this
+                    # parameter `model`.
+                    model=self.murf_model,
+                ):
+                    if chunk:
+                        proc.stdin.write(chunk)
+            except Exception as err:  # surfaced after stdout drains
+                feed_errors.append(err)
+            finally:
+                proc.stdin.close()
+
+        feeder = threading.Thread(target=_feed, daemon=True)
+        feeder.start()
+        raw = proc.stdout.read()
+        stderr = proc.stderr.read()
+        feeder.join()
+        returncode = proc.wait()
+        if feed_errors:
+            raise feed_errors[0]
+        if returncode != 0 or not raw:
+            detail = stderr.decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"ffmpeg failed to decode streamed Murf audio: {detail}")
+        return self._pcm_from_raw(raw)
+
+    def _tts_cache_path(self, script: str) -> Path:
+        key = hashlib.blake2b(
+            f"{self.voice_id}|{self.murf_model}|{script}".encode("utf-8")
+        ).hexdigest()
+        return self._cache_dir / f"{key}.pcm"
+
+    def _synthesize(self, script: str) -> np.ndarray:
+        # Re-running the same script (the dev loop does this constantly)
+        # should not hit Murf again: cache decoded PCM keyed on
+        # (voice, model, script).
+        cache_path = self._tts_cache_path(script)
+        if cache_path.exists():
+            logger.info("Agent 3: reusing cached Murf synthesis (%s).", cache_path.name)
+            raw = cache_path.read_bytes()
+            # Refresh the mtime so eviction is least-recently-used rather
+            # than oldest-written.
+            os.utime(cache_path)
+            return self._pcm_from_raw(raw)
+        pcm = self._synthesize_uncached(script)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_bytes(pcm.tobytes())
+        os.replace(tmp_path, cache_path)
+        self._trim_tts_cache()
+        return pcm
+
+    def _trim_tts_cache(self) -> None:
+        """Evict least-recently-used cache entries past the size cap."""
+        entries = []
+        total = 0
+        with os.scandir(self._cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".pcm"):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total <= self.tts_cache_max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:  # already evicted by a concurrent worker
+                continue
+            total -= size
+            if total <= self.tts_cache_max_bytes:
+                break
+
+    def _synthesize_uncached(self, script: str) -> np.ndarray:
         logger.info("Agent 3: synthesizing speech via Murf.")
+        # Prefer the chunked streaming endpoint when the SDK exposes one:
+        # PCM frames materialize while Murf is still rendering instead of
+        # after the full payload lands.
+        try:
+            streamed = self._synthesize_streaming(script)
+        except Exception as err:
+            logger.warning(
+                "Murf streaming synthesis failed (%s); falling back to batch request.",
+                err,
+            )
+            streamed = None
+        if streamed is not None:
+            return streamed
+        # Ask for WAV rather than MP3: the payload is decoded straight back
+        # to PCM for mixing, so an MP3 round-trip is a wasted (and lossy)
+        # encode/decode on Murf's side and ours.
         response = self.tts_client.text_to_speech.generate(
             text=script,
             voice_id=self.voice_id,
-            format="MP3",
+            format="WAV",
             sample_rate=44100,
             model_version=self.murf_model,
             encode_as_base_64=True,
         )
-        # The Murf SDK may return different attribute or key names depending
-        # on version and serialization (camelCase vs snake_case). Be defensive
-        # and try multiple options for locating the audio payload.
         audio_bytes: Optional[bytes] = None
 
-        def _resp_to_mapping(obj: Any) -> Dict[str, Any]:
-            if obj is None:
-                return {}
-            if isinstance(obj, dict):
-                return obj
-            # try dataclass / SDK object conversions
-            if hasattr(obj, "to_dict") and callable(getattr(obj, "to_dict")):
-                try:
-                    return obj.to_dict()
-                except Exception:
-                    pass
-            if hasattr(obj, "__dict__"):
-                return {k: v for k, v in vars(obj).items() if not k.startswith("_")}
-            return {}
-
-        resp_map = _resp_to_mapping(response)
+        def _lookup(keys: Tuple[str, ...]) -> Tuple[Optional[str], Any]:
+            # Attribute access first (cheap slot/descriptor lookup on SDK
+            # objects); only fall back to mapping access for plain dicts.
+            # No throwaway dict is built either way.
+            for key in keys:
+                value = getattr(response, key, None)
+                if value:
+                    return key, value
+            if isinstance(response, dict):
+                for key in keys:
+                    value = response.get(key)
+                    if value:
+                        return key, value
+            return None, None
 
         # Try common names for base64-encoded audio
-        for encoded_key in ("encoded_audio", "encodedAudio", "encodedAudioBase64", "encodedAudio64"):
-            encoded_val = resp_map.get(encoded_key) or getattr(response, encoded_key, None)
-            if encoded_val:
-                logger.debug("Found encoded audio via key %s", encoded_key)
-                try:
-                    audio_bytes = base64.b64decode(encoded_val)
-                except Exception as err:
-                    raise ValueError("Failed to decode base64 audio from Murf response: %s" % err)
-                break
+        encoded_key, encoded_val = _lookup(_AUDIO_KEYS)
+        if encoded_val:
+            logger.debug("Found encoded audio via key %s", encoded_key)
+            try:
+                audio_bytes = base64.b64decode(encoded_val)
+            except Exception as err:
+                raise ValueError("Failed to decode base64 audio from Murf response: %s" % err)
 
         # Try signed URL / file URL fields
         if audio_bytes is None:
-            for url_key in ("audio_file", "audioFile", "url", "audio_url", "signedUrl"):
-                url_val = resp_map.get(url_key) or getattr(response, url_key, None)
-                if url_val:
-                    logger.info("Downloading Murf audio from URL field '%s'.", url_key)
-                    try:
-                        resp = requests.get(url_val, timeout=self.http_timeout)
-                        resp.raise_for_status()
-                        audio_bytes = resp.content
-                    except Exception as err:
-                        raise ValueError(f"Failed to download Murf audio from URL ({url_key}): {err}")
-                    break
+            url_key, url_val = _lookup(_URL_KEYS)
+            if url_val:
+                logger.info("Downloading Murf audio from URL field '%s'.", url_key)
+                try:
+                    resp = requests.get(url_val, timeout=self.http_timeout)
+                    resp.raise_for_status()
+                    audio_bytes = resp.content
+                except Exception as err:
+                    raise ValueError(f"Failed to download Murf audio from URL ({url_key}): {err}")
 
         # Some SDKs may return raw bytes directly
         if audio_bytes is None:
@@ -152,58 +385,110 @@ class AudioGeneratorAgent:
         if not audio_bytes:
             raise ValueError("Murf returned no audio payload (checked several fields).")
 
-        try:
-            speech_segment = AudioSegment.from_file(io.BytesIO(audio_bytes), format="mp3")
-        except Exception as err:
-            raise RuntimeError(f"Failed to parse audio bytes into AudioSegment: {err}")
-
-        return _standardize_segment(speech_segment)
+        return self._decode_audio_bytes(audio_bytes)
 
-    def _load_music(self, path: Path, *, fade_in: int = 0, fade_out: int = 0) -> AudioSegment:
+    def _decode_to_pcm(self, path: Path, *, fade_in: int = 0, fade_out: int = 0) -> np.ndarray:
+        """Decode a fixed asset to int16 PCM, applying fades as linear ramps."""
         if not path.exists():
             raise FileNotFoundError(f"Required audio asset missing: {path}")
-        segment = AudioSegment.from_file(path)
-        # Only apply fades when a positive duration is provided. Some
-        # pydub versions raise if fade duration is None or start/end
-        # calculations produce None.
-        if fade_in and fade_in > 0:
-            segment = segment.fade_in(int(fade_in))
-        if fade_out and fade_out > 0:
-            segment = segment.fade_out(int(fade_out))
-        return _standardize_segment(segment)
-
-    def _post_mix(self, segment: AudioSegment) -> AudioSegment:
-        if segment.max_dBFS > 0:
-            segment = segment.apply_gain(-segment.max_dBFS)
-        return _normalize_lufs(segment, self.target_lufs)
+        pcm = _to_pcm(AudioSegment.from_file(path))
+        # Only apply fades when a positive duration (in ms) is provided.
+        if fade_in > 0 or fade_out > 0:
+            pcm = pcm.copy()
+        if fade_in > 0:
+            n = min(int(fade_in) * 44100 // 1000, len(pcm))
+            ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
+            pcm[:n] = (pcm[:n] * ramp[:, None]).astype(np.int16)
+        if fade_out > 0:
+            n = min(int(fade_out) * 44100 // 1000, len(pcm))
+            ramp = np.linspace(1.0, 0.0, n, dtype=np.float32)
+            pcm[len(pcm) - n :] = (pcm[len(pcm) - n :] * ramp[:, None]).astype(np.int16)
+        return pcm
+
+    def _post_mix(self, mix: np.ndarray) -> np.ndarray:
+        mono = _to_mono_float(mix)
+        if float(np.abs(mono).max(initial=0.0)) <= 1e-6:
+            return mix
+        loudness = float(_meter(44100).integrated_loudness(mono))
+        # Trimming peaks to 0 dBFS shifts integrated loudness by the same
+        # amount, so the old trim + normalize steps collapse into one gain,
+        # applied in place on the shared mix buffer.
+        _apply_gain_inplace(mix, self.target_lufs - loudness)
+        return mix
+
+    def synthesize_chunk(self, text: str) -> np.ndarray:
+        """Synthesize one script chunk into loudness-normalized speech PCM."""
+        return _normalize_lufs_pcm(
+            self._synthesize(text), self.target_lufs + self.speech_delta_db
+        )
 
     @retry(wait=wait_fixed(2), stop=stop_after_attempt(2), reraise=True)
     def _run(self, inputs: Dict[str, str]) -> Dict[str, str]:
         script = inputs.get("podcast_script")
         if not script:
             raise ValueError("podcast_script is required to create audio.")
-
-        speech = _normalize_lufs(self._synthesize(script), self.target_lufs + self.speech_delta_db)
-        intro_music = _normalize_lufs(
-            self._load_music(self.intro_path, fade_in=2000),
-            self.target_lufs + self.music_delta_db,
-        )
-        outro_music = _normalize_lufs(
-            self._load_music(self.outro_path, fade_out=1500),
-            self.target_lufs + self.music_delta_db,
-        )
-
+        return self.render([self.synthesize_chunk(script)], inputs.get("output_path"))
+
+    def render(
+        self,
+        speech_chunks: Sequence[np.ndarray],
+        output_path: Optional[Path] = None,
+    ) -> Dict[str, str]:
+        """Mix intro, ordered speech chunks, and outro, then export the MP3.
+
+        ``output_path`` overrides the agent's default destination so
+        concurrent runs (e.g. parallel web conversions) each encode to
+        their own file instead of clobbering a shared one.
+        """
+        dest = Path(output_path) if output_path else self.output_path
         logger.info("Agent 3: mixing intro, speech, and outro.")
-        composite = intro_music + speech + outro_music
-        final_audio = self._post_mix(composite)
-        final_audio.export(
-            self.output_path,
-            format="mp3",
-            bitrate="320k",
-            parameters=["-ar", "44100"],
+        # Assemble the episode in one preallocated int16 buffer instead of
+        # pydub's `+` operator, which copies the accumulated bytestring on
+        # every append.
+        parts = [self._intro_pcm, *speech_chunks, self._outro_pcm]
+        mix = np.empty((sum(len(part) for part in parts), 2), dtype=np.int16)
+        offset = 0
+        for part in parts:
+            np.copyto(mix[offset : offset + len(part)], part)
+            offset += len(part)
+
+        final_pcm = self._post_mix(mix)
+        # Feed the buffer to ffmpeg over stdin; pydub's export would first
+        # spool it to a temporary WAV file just to hand ffmpeg the same bytes.
+        command = self._ffmpeg_encode_command(str(dest))
+        proc = subprocess.run(command, input=final_pcm.tobytes(), stderr=subprocess.PIPE)
+        if proc.returncode != 0:
+            detail = proc.stderr.decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"ffmpeg failed to encode the final MP3: {detail}")
+        logger.info("Agent 3: final audio exported to %s", dest)
+        return {"final_audio_path": str(dest)}
+
+    def encode_mp3(self, pcm: np.ndarray) -> bytes:
+        """Encode one PCM buffer to MP3 frames via an ffmpeg pipe."""
+        command = self._ffmpeg_encode_command("-f", "mp3", "pipe:1")
+        proc = subprocess.run(
+            command,
+            input=pcm.tobytes(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
         )
-        logger.info("Agent 3: final audio exported to %s", self.output_path)
-        return {"final_audio_path": str(self.output_path)}
+        if proc.returncode != 0 or not proc.stdout:
+            detail = proc.stderr.decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"ffmpeg failed to encode an MP3 chunk: {detail}")
+        return proc.stdout
+
+    def iter_mp3(self, script_chunks: Iterable[str]) -> Iterator[bytes]:
+        """Yield the episode incrementally: intro, per-chunk speech, outro.
+
+        Consecutive MP3 frame runs concatenate into a valid stream, so each
+        chunk is playable as soon as it is yielded. The low-latency path
+        keeps per-stem loudness normalization but skips the whole-episode
+        post-mix pass, which needs the complete buffer.
+        """
+        yield self.encode_mp3(self._intro_pcm)
+        for text in script_chunks:
+            yield self.encode_mp3(self.synthesize_chunk(text))
+        yield self.encode_mp3(self._outro_pcm)
 
     def _ensure_audio_toolchain(self) -> None:
         ffmpeg_path = AudioSegment.converter
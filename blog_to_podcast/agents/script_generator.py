@@ -5,9 +5,10 @@ Agent that converts cleaned blog text into a podcast script.
 from __future__ import annotations
 
 import logging
+import re
 import textwrap
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from langchain_core.runnables import RunnableLambda
 from tenacity import retry, stop_after_attempt, wait_fixed
@@ -16,6 +17,11 @@ from blog_to_podcast.core.groq_client import GroqClient
 
 logger = logging.getLogger(__name__)
 
+# Precompiled once: the fallback writer runs these over up to 30k characters
+# and textwrap.shorten re-tokenizes the whole string on every call.
+_WS_RE = re.compile(r"\s+")
+_SENT_RE = re.compile(r"^[^.?!]{1,160}")
+
 SYSTEM_PROMPT = (
     "You are an expert podcast scriptwriter. Convert structured or unstructured "
     "blog content into a casual, friendly, engaging podcast script.\n\n"
@@ -67,6 +73,46 @@ class ScriptGeneratorAgent:
             fallback_script = self._build_fallback_script(blog_text)
             return {"podcast_script": fallback_script}
 
+    def stream_script(self, clean_blog_text: str) -> Iterator[str]:
+        """Yield the script paragraph by paragraph while Groq is still streaming.
+
+        Falls back to the offline writer only when nothing has been yielded
+        yet; a failure mid-stream propagates so the caller can restart on the
+        non-streaming path instead of stitching fallback text onto a partial
+        script.
+        """
+        if not clean_blog_text:
+            raise ValueError("clean_blog_text is required for script generation.")
+        logger.info("Agent 2: streaming podcast script from Groq.")
+        prompt = self._build_prompt(clean_blog_text)
+        buffer = ""
+        yielded = False
+        try:
+            for delta in self.groq_client.stream_groq(SYSTEM_PROMPT, prompt):
+                buffer += delta
+                while "\n\n" in buffer:
+                    paragraph, buffer = buffer.split("\n\n", 1)
+                    paragraph = paragraph.strip()
+                    if not paragraph:
+                        continue
+                    if not yielded:
+                        self._ensure_valid_script(paragraph)
+                    yielded = True
+                    yield paragraph
+            tail = buffer.strip()
+            if tail:
+                if not yielded:
+                    self._ensure_valid_script(tail)
+                yielded = True
+                yield tail
+            if not yielded:
+                raise ValueError("Groq stream produced an empty script.")
+        except Exception as error:
+            if yielded:
+                raise
+            logger.warning("Groq stream unavailable (%s). Using fallback writer.", error)
+            yield self._build_fallback_script(clean_blog_text)
+
     def _ensure_valid_script(self, script: str) -> None:
         snippet = script.lstrip()[:80].lower()
         if any(snippet.startswith(prefix) for prefix in ("<!doctype", "<html", "<!doctype html")):
@@ -84,12 +130,14 @@ class ScriptGeneratorAgent:
 
         paragraphs = [p.strip() for p in trimmed.split("\n") if p.strip()]
         opener = paragraphs[0] if paragraphs else ""
-        # Allow a longer opener to avoid truncation for longer titles
-        opener = textwrap.shorten(opener, width=600, placeholder="...")
+        # Allow a longer opener to avoid truncation for longer titles. One
+        # whitespace-collapse pass plus a slice replaces textwrap.shorten,
+        # which re-tokenizes the full string per call.
+        opener = _WS_RE.sub(" ", opener)[:600]
 
         body_text = " ".join(paragraphs[1:]) if len(paragraphs) > 1 else trimmed
         # Increase fallback body width so longer articles produce fuller fallback scripts
-        body_text = textwrap.shorten(body_text, width=5000, placeholder="...")
+        body_text = _WS_RE.sub(" ", body_text)[:5000]
 
         key_points = self._extract_key_points(paragraphs)
         formatted_points = "\n".join(f"- {point}" for point in key_points)
@@ -113,10 +161,10 @@ That's a wrap for this quick conversion. Once Groq is reachable again, run the s
     def _extract_key_points(self, paragraphs: List[str]) -> List[str]:
         points: List[str] = []
         for paragraph in paragraphs[:6]:
-            sentence = paragraph.split(".")[0].strip()
+            match = _SENT_RE.match(paragraph)
+            sentence = match.group(0).strip() if match else ""
             if not sentence:
                 continue
-            sentence = textwrap.shorten(sentence, width=160, placeholder="...")
             if sentence not in points:
                 points.append(sentence)
             if len(points) == 4:
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Optional
+from typing import Iterator, Optional
 
 from dotenv import load_dotenv
 from groq import Groq, GroqError
@@ -65,4 +65,29 @@ class GroqClient:
             raise ValueError("Groq response choice did not include content.")
         return content.strip()
 
+    def stream_groq(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        """
+        Yield completion content deltas as Groq streams them.
+        """
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                temperature=self.temperature,
+                max_tokens=self.max_output_tokens,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                stream=True,
+            )
+        except GroqError as api_error:
+            logger.error("Groq API error: %s", api_error)
+            raise
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
 
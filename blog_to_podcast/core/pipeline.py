@@ -5,9 +5,10 @@ Orchestrates the 3-agent workflow using LangChain runnables.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from blog_to_podcast.agents.audio_generator import AudioGeneratorAgent
 from blog_to_podcast.agents.blog_cleaner import BlogCleanerAgent
@@ -17,10 +18,6 @@ from blog_to_podcast.core.groq_client import GroqClient
 logger = logging.getLogger(__name__)
 
 
-def _timestamp() -> str:
-    return datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-
-
 @dataclass
 class BlogToPodcastPipeline:
     """
@@ -36,9 +33,85 @@ class BlogToPodcastPipeline:
         self.script_agent = ScriptGeneratorAgent(groq_client=self.groq_client)
 
     def _log_step(self, message: str) -> None:
-        logger.info("[%s] %s", _timestamp(), message)
-
-    def run(self, *, blog_source: str) -> Dict[str, str]:
+        # Timestamps come from the logging formatter's %(asctime)s, which
+        # caches the formatted time, instead of a per-call datetime+strftime.
+        logger.info("%s", message)
+
+    def _run_streaming(
+        self,
+        cleaned: Dict[str, str],
+        output_path: Optional[Path] = None,
+    ) -> Tuple[str, Dict[str, str]]:
+        """Overlap Murf synthesis with Groq streaming, paragraph by paragraph.
+
+        Each completed script paragraph is handed to the audio agent while
+        Groq is still generating the rest, so TTS latency hides behind the
+        script stream instead of starting after it.
+        """
+        paragraphs: List[str] = []
+        futures = []
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            for paragraph in self.script_agent.stream_script(
+                cleaned["clean_blog_text"]
+            ):
+                paragraphs.append(paragraph)
+                futures.append(pool.submit(self.audio_agent.synthesize_chunk, paragraph))
+            speech_chunks = [future.result() for future in futures]
+        script_text = "\n\n".join(paragraphs)
+        audio_result = self.audio_agent.render(speech_chunks, output_path)
+        return script_text, audio_result
+
+    def iter_events(
+        self,
+        *,
+        blog_source: str,
+        output_path: Optional[Path] = None,
+    ) -> Iterator[Tuple[str, object]]:
+        """Yield ("script", paragraph) events, then one ("audio", result).
+
+        Script paragraphs surface as soon as Groq emits them while Murf
+        synthesis runs in the background, so callers (e.g. the SSE endpoint)
+        can show progress long before the final MP3 exists.
+        """
+        if not blog_source:
+            raise ValueError("A blog URL or raw text source is required.")
+        self._log_step("Event pipeline start.")
+        cleaned = self.blog_agent.runnable.invoke({"blog_source": blog_source})
+        self._log_step("Blog cleaned.")
+        futures = []
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            for paragraph in self.script_agent.stream_script(
+                cleaned["clean_blog_text"]
+            ):
+                futures.append(pool.submit(self.audio_agent.synthesize_chunk, paragraph))
+                yield "script", paragraph
+            speech_chunks = [future.result() for future in futures]
+        audio_result = self.audio_agent.render(speech_chunks, output_path)
+        self._log_step("Event pipeline complete.")
+        yield "audio", audio_result
+
+    def iter_audio(self, *, blog_source: str) -> Iterator[bytes]:
+        """Stream the episode as MP3 chunks while it is still being produced.
+
+        Unlike run(), nothing is written to disk and the whole-episode
+        post-mix normalization is skipped; the first audible bytes arrive as
+        soon as the first script paragraph has been synthesized.
+        """
+        if not blog_source:
+            raise ValueError("A blog URL or raw text source is required.")
+        self._log_step("Streaming pipeline start.")
+        cleaned = self.blog_agent.runnable.invoke({"blog_source": blog_source})
+        self._log_step("Blog cleaned.")
+        script_chunks = self.script_agent.stream_script(cleaned["clean_blog_text"])
+        yield from self.audio_agent.iter_mp3(script_chunks)
+        self._log_step("Streaming pipeline complete.")
+
+    def run(
+        self,
+        *,
+        blog_source: str,
+        output_path: Optional[Path] = None,
+    ) -> Dict[str, str]:
         if not blog_source:
             raise ValueError("A blog URL or raw text source is required.")
 
@@ -46,18 +119,31 @@ class BlogToPodcastPipeline:
         cleaned = self.blog_agent.runnable.invoke({"blog_source": blog_source})
         self._log_step("Blog cleaned.")
 
-        script_result = self.script_agent.runnable.invoke(cleaned)
-        script_text = script_result["podcast_script"]
+        try:
+            script_text, audio_result = self._run_streaming(cleaned, output_path)
+            script_result = {"podcast_script": script_text}
+        except Exception as exc:
+            logger.warning(
+                "Streaming script/TTS overlap failed (%s). Falling back to sequential agents.",
+                exc,
+            )
+            script_result = self.script_agent.runnable.invoke(cleaned)
+            script_text = script_result["podcast_script"]
+            audio_result = None
+
         self._log_step("Podcast script ready.")
         print("\n===== PODCAST SCRIPT =====\n")
         print(script_text)
         print("\n===== END SCRIPT =====\n")
 
-        try:
-            audio_result = self.audio_agent.runnable.invoke(script_result)
-        except Exception as exc:  # pragma: no cover - surfaced via CLI/HTTP
-            logger.exception("Audio agent failed: %s", exc)
-            raise
+        if audio_result is None:
+            try:
+                audio_result = self.audio_agent.runnable.invoke(
+                    {**script_result, "output_path": output_path}
+                )
+            except Exception as exc:  # pragma: no cover - surfaced via CLI/HTTP
+                logger.exception("Audio agent failed: %s", exc)
+                raise
         self._log_step("Audio generation complete.")
         self._log_step(f"Final MP3: {audio_result['final_audio_path']}")
         return {
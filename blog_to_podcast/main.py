@@ -41,7 +41,8 @@ def resolve_source(args: argparse.Namespace) -> str:
 def main() -> None:
     logging.basicConfig(
         level=logging.INFO,
-        format="%(levelname)s | %(message)s",
+        format="%(asctime)s | %(levelname)s | %(message)s",
+        datefmt="%H:%M:%S",
     )
     args = parse_args()
     source = resolve_source(args)
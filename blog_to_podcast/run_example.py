@@ -17,7 +17,11 @@ from blog_to_podcast.core.pipeline import BlogToPodcastPipeline
 
 
 def main() -> None:
-    logging.basicConfig(level=logging.INFO, format="%(levelname)s | %(message)s")
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(message)s",
+        datefmt="%H:%M:%S",
+    )
     load_dotenv()
     sample_text = (
         "Today we're discussing how to convert blog posts into natural-sounding podcast episodes. "
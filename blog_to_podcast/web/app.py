@@ -1,41 +1,172 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
+import hashlib
+import os
+import re
+import shutil
+import threading
 import time
+import unicodedata
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from email.utils import formatdate
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-from fastapi import FastAPI, HTTPException
-from fastapi.concurrency import run_in_threadpool
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field, field_validator
 
 from blog_to_podcast.core.pipeline import BlogToPodcastPipeline
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm everything at startup (after any fork) instead of on the first
+    # request: build the in-process streaming pipeline off the event loop
+    # and spin up a pool worker so its initializer runs now.
+    await asyncio.to_thread(_local_pipeline)
+    await asyncio.get_running_loop().run_in_executor(EXECUTOR, os.getpid)
+    yield
+    EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
+
 app = FastAPI(
     title="Blog → Podcast Studio",
     description="Paste any blog URL or raw text and generate a narrated podcast episode.",
+    # orjson serializes straight to UTF-8 bytes, several times faster than
+    # the stdlib json path for the multi-KB script payloads we return.
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
-pipeline = BlogToPodcastPipeline()
+# Generous headroom over the model's 200k-char text limit in UTF-8.
+_MAX_BODY_BYTES = 1024 * 1024
+
+
+class _BodyLimitMiddleware:
+    """Reject oversized uploads from the declared Content-Length alone.
+
+    Pure ASGI so the check runs before FastAPI touches the request, and the
+    body of an abusive request is never read off the socket, let alone
+    parsed — without this, a huge paste ties up a pipeline worker for
+    minutes before failing.
+    """
+
+    def __init__(self, app, max_bytes: int) -> None:
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    try:
+                        too_big = int(value) > self.max_bytes
+                    except ValueError:
+                        too_big = True
+                    if too_big:
+                        response = ORJSONResponse(
+                            {"detail": "Request body too large."},
+                            status_code=413,
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(_BodyLimitMiddleware, max_bytes=_MAX_BODY_BYTES)
+
 OUTPUT_PATH = Path("blog_to_podcast/output/final_podcast.mp3")
 
+# Each conversion occupies a worker for many seconds; without a gate a burst
+# of requests exhausts the pool and starves every other endpoint. Saturated
+# requests fail fast with 429 instead of queueing.
+PIPELINE_CONCURRENCY = int(os.getenv("PIPELINE_CONCURRENCY", str(os.cpu_count() or 2)))
+PIPELINE_SEM = asyncio.Semaphore(PIPELINE_CONCURRENCY)
+PIPELINE_ACQUIRE_TIMEOUT = 1.0
+
+# The pipeline mixes CPU-heavy audio work with network IO; threads share the
+# GIL, so conversions run in worker processes that each build their own
+# pipeline once at startup.
+_WORKER_PIPELINE: Optional[BlogToPodcastPipeline] = None
+
+
+def _init_worker() -> None:
+    global _WORKER_PIPELINE
+    _WORKER_PIPELINE = BlogToPodcastPipeline()
+
+
+def _run_pipeline(source: str, output_name: Optional[str] = None) -> Dict[str, str]:
+    if _WORKER_PIPELINE is None:  # pragma: no cover - initializer always ran
+        raise RuntimeError("Pipeline worker was not initialized.")
+    output_path = OUTPUT_PATH.parent / output_name if output_name else None
+    return _WORKER_PIPELINE.run(blog_source=source, output_path=output_path)
+
+
+EXECUTOR = ProcessPoolExecutor(
+    max_workers=PIPELINE_CONCURRENCY,
+    initializer=_init_worker,
+)
+
+# Streaming endpoints need in-process access to the pipeline's chunk
+# generators (PCM can't cross the process boundary incrementally), so they
+# use a lazily built local instance instead of the worker pool.
+_LOCAL_PIPELINE: Optional[BlogToPodcastPipeline] = None
+_LOCAL_PIPELINE_LOCK = threading.Lock()
+
+
+def _local_pipeline() -> BlogToPodcastPipeline:
+    global _LOCAL_PIPELINE
+    with _LOCAL_PIPELINE_LOCK:
+        if _LOCAL_PIPELINE is None:
+            _LOCAL_PIPELINE = BlogToPodcastPipeline()
+    return _LOCAL_PIPELINE
+
 
 class ConvertRequest(BaseModel):
-    url: Optional[str] = Field(None, description="Blog URL to process")
-    text: Optional[str] = Field(None, description="Raw blog text to convert")
+    # Keep validation on the Rust-backed fast path: drop unknown keys instead
+    # of carrying them and strip whitespace during parsing rather than with
+    # Python-level post-processing. Stripping here also canonicalizes the
+    # source for the dedupe cache key.
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
 
+    url: Optional[AnyHttpUrl] = Field(None, description="Blog URL to process")
+    text: Optional[str] = Field(
+        None,
+        max_length=200_000,
+        description="Raw blog text to convert",
+    )
 
-def _build_index_html() -> str:
-    return """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1.0" />
-  <title>Blog → Podcast Studio</title>
-  <style>
-    :root {
+    @field_validator("url", "text", mode="before")
+    @classmethod
+    def _blank_to_none(cls, value: object) -> object:
+        # The page always posts both fields, with "" for the one left empty;
+        # AnyHttpUrl would otherwise reject the blank url with a 422 before
+        # the handler ever runs.
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
+
+    @field_validator("text")
+    @classmethod
+    def _canonicalize_text(cls, value: Optional[str]) -> Optional[str]:
+        # NFC-normalize once at the edge so every downstream stage — and in
+        # particular the content-hash dedupe key — sees canonical input.
+        if value:
+            return unicodedata.normalize("NFC", value)
+        return value
+
+    @property
+    def source(self) -> Optional[str]:
+        return str(self.url) if self.url else self.text
+
+
+_CSS = r"""    :root {
       color-scheme: dark;
       --bg: #0f172a;
       --card: rgba(15, 23, 42, 0.85);
@@ -177,7 +308,125 @@ def _build_index_html() -> str:
       .app { padding: 1.5rem; border-radius: 18px; }
       button { width: 100%; }
     }
-  </style>
+"""
+
+_JS = r"""    const form = document.getElementById("podcast-form");
+    const statusEl = document.getElementById("status");
+    const runBtn = document.getElementById("run-btn");
+    const results = document.getElementById("results");
+    const scriptOutput = document.getElementById("script-output");
+    const downloadLink = document.getElementById("download-link");
+
+    async function errorMessage(response) {
+      // Validation errors (422) carry a list of {msg, loc} objects; plain
+      // HTTPExceptions carry a string.
+      const errorData = await response.json();
+      const detail = errorData.detail;
+      if (Array.isArray(detail)) {
+        return detail.map((item) => item.msg).join("; ");
+      }
+      return detail || "Conversion failed.";
+    }
+
+    async function convertBuffered(payload) {
+      const response = await fetch("/api/convert", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(payload),
+      });
+      if (!response.ok) {
+        throw new Error(await errorMessage(response));
+      }
+      const data = await response.json();
+      scriptOutput.textContent = data.script || "(Empty script)";
+      downloadLink.href = data.audio_url;
+      results.classList.add("active");
+    }
+
+    async function convertStreaming(payload) {
+      // POST bodies rule out EventSource, so parse the SSE frames off a
+      // fetch stream instead: script paragraphs render as they arrive.
+      const response = await fetch("/api/convert/sse", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(payload),
+      });
+      if (!response.ok) {
+        throw new Error(await errorMessage(response));
+      }
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = "";
+      let sawAudio = false;
+      scriptOutput.textContent = "";
+      results.classList.add("active");
+      while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        let sep;
+        while ((sep = buffer.indexOf("\n\n")) !== -1) {
+          const frame = buffer.slice(0, sep);
+          buffer = buffer.slice(sep + 2);
+          let name = "message";
+          const dataLines = [];
+          for (const line of frame.split("\n")) {
+            if (line.startsWith("event: ")) name = line.slice(7);
+            else if (line.startsWith("data: ")) dataLines.push(line.slice(6));
+          }
+          const data = dataLines.join("\n");
+          if (name === "script") {
+            scriptOutput.textContent += (scriptOutput.textContent ? "\n\n" : "") + data;
+            statusEl.textContent = "Narrating your script...";
+          } else if (name === "audio") {
+            downloadLink.href = data;
+            sawAudio = true;
+          } else if (name === "error") {
+            throw new Error(data);
+          }
+        }
+      }
+      if (!sawAudio) throw new Error("Stream ended before the audio was ready.");
+    }
+
+    form.addEventListener("submit", async (event) => {
+      event.preventDefault();
+      const url = document.getElementById("url").value.trim();
+      const text = document.getElementById("text").value.trim();
+
+      if (!url && !text) {
+        statusEl.textContent = "Please provide either a URL or raw text.";
+        return;
+      }
+
+      runBtn.disabled = true;
+      statusEl.textContent = "Brewing your podcast...";
+      results.classList.remove("active");
+
+      try {
+        if (window.ReadableStream && window.TextDecoder) {
+          await convertStreaming({ url, text });
+        } else {
+          await convertBuffered({ url, text });
+        }
+        statusEl.textContent = "Done! Grab your script + MP3 below.";
+      } catch (error) {
+        console.error(error);
+        statusEl.textContent = error.message || "Something went wrong.";
+      } finally {
+        runBtn.disabled = false;
+      }
+    });
+"""
+
+_SHELL = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+  <title>Blog → Podcast Studio</title>
+  <link rel="stylesheet" href="__CSS_HREF__" />
 </head>
 <body>
   <div class="app">
@@ -211,92 +460,637 @@ def _build_index_html() -> str:
     </section>
   </div>
 
-  <script>
-    const form = document.getElementById("podcast-form");
-    const statusEl = document.getElementById("status");
-    const runBtn = document.getElementById("run-btn");
-    const results = document.getElementById("results");
-    const scriptOutput = document.getElementById("script-output");
-    const downloadLink = document.getElementById("download-link");
+  <script>__JS__</script>
+</body>
+</html>
+"""
 
-    form.addEventListener("submit", async (event) => {
-      event.preventDefault();
-      const url = document.getElementById("url").value.trim();
-      const text = document.getElementById("text").value.trim();
+# Build-time minification: run once at import when the (optional) minifiers
+# are installed, otherwise ship the readable source unchanged.
+try:
+    import rcssmin
 
-      if (!url && !text) {
-        statusEl.textContent = "Please provide either a URL or raw text.";
-        return;
-      }
+    _CSS_TEXT = rcssmin.cssmin(_CSS)
+except ImportError:
+    _CSS_TEXT = _CSS
+try:
+    import rjsmin
 
-      runBtn.disabled = true;
-      statusEl.textContent = "Brewing your podcast...";
-      results.classList.remove("active");
+    _JS_TEXT = rjsmin.jsmin(_JS)
+except ImportError:
+    _JS_TEXT = _JS
 
-      try {
-        const response = await fetch("/api/convert", {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({ url, text }),
-        });
-        if (!response.ok) {
-          const errorData = await response.json();
-          throw new Error(errorData.detail || "Conversion failed.");
+# The stylesheet ships separately under a content-versioned URL with a
+# year-long immutable max-age, so repeat visitors pay zero HTML bytes for it;
+# the JS stays inline to keep first paint to a single round-trip.
+CSS_BYTES = _CSS_TEXT.encode("utf-8")
+CSS_GZ = gzip.compress(CSS_BYTES, 9)
+_CSS_VERSION = hashlib.blake2b(CSS_BYTES, digest_size=8).hexdigest()
+CSS_ETAG = f'"{_CSS_VERSION}"'
+_CSS_HEADERS = {
+    "ETag": CSS_ETAG,
+    "Cache-Control": "public, max-age=31536000, immutable",
+    "Vary": "Accept-Encoding",
+}
+CSS_RESPONSE = Response(
+    content=CSS_BYTES,
+    media_type="text/css; charset=utf-8",
+    headers=_CSS_HEADERS,
+)
+CSS_RESPONSE_GZ = Response(
+    content=CSS_GZ,
+    media_type="text/css; charset=utf-8",
+    headers={**_CSS_HEADERS, "Content-Encoding": "gzip"},
+)
+
+
+def _build_index_html() -> str:
+    return _SHELL.replace(
+        "__CSS_HREF__", f"/static/app.css?v={_CSS_VERSION}"
+    ).replace("__JS__", _JS_TEXT)
+
+
+# The page is a constant: encode and compress it once at import instead of
+# rebuilding the same ~6KB string on every GET. A strong ETag lets repeat
+# visitors skip the body entirely with a 304.
+INDEX_HTML_BYTES = _build_index_html().encode("utf-8")
+INDEX_HTML_GZ = gzip.compress(INDEX_HTML_BYTES, 9)
+INDEX_ETAG = '"' + hashlib.blake2b(INDEX_HTML_BYTES, digest_size=8).hexdigest() + '"'
+_INDEX_HEADERS = {
+    "ETag": INDEX_ETAG,
+    "Cache-Control": "public, max-age=3600",
+    "Vary": "Accept-Encoding",
+}
+INDEX_RESPONSE = Response(
+    content=INDEX_HTML_BYTES,
+    media_type="text/html; charset=utf-8",
+    headers=_INDEX_HEADERS,
+)
+INDEX_RESPONSE_GZ = Response(
+    content=INDEX_HTML_GZ,
+    media_type="text/html; charset=utf-8",
+    headers={**_INDEX_HEADERS, "Content-Encoding": "gzip"},
+)
+
+
+@app.get("/")
+async def index(request: Request) -> Response:
+    if request.headers.get("if-none-match") == INDEX_ETAG:
+        return Response(status_code=304, headers=_INDEX_HEADERS)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return INDEX_RESPONSE_GZ
+    return INDEX_RESPONSE
+
+
+@app.get("/static/app.css")
+async def app_css(request: Request) -> Response:
+    if request.headers.get("if-none-match") == CSS_ETAG:
+        return Response(status_code=304, headers=_CSS_HEADERS)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return CSS_RESPONSE_GZ
+    return CSS_RESPONSE
+
+
+# Conversions are deterministic per input, so duplicate concurrent requests
+# for the same source await one shared future instead of running the pipeline
+# twice, and recently completed sources come straight from an LRU cache.
+_INFLIGHT: Dict[str, asyncio.Future] = {}
+_RESULTS: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+_RESULTS_MAX = 256
+
+
+def _source_key(source: str) -> str:
+    return hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _convert_response(result: Dict[str, str], key: str) -> ORJSONResponse:
+    return ORJSONResponse(
+        {
+            "script": result.get("podcast_script", ""),
+            "audio_url": f"/download/{key}.mp3",
         }
-        const data = await response.json();
-        scriptOutput.textContent = data.script || "(Empty script)";
-        downloadLink.href = data.audio_url;
-        results.classList.add("active");
-        statusEl.textContent = "Done! Grab your script + MP3 below.";
-      } catch (error) {
-        console.error(error);
-        statusEl.textContent = error.message || "Something went wrong.";
-      } finally {
-        runBtn.disabled = false;
-      }
-    });
-  </script>
-</body>
-</html>
-"""
+    )
+
+
+def _scratch_name(key: str) -> str:
+    # Per-run encoder destination. The uuid makes it unique even for
+    # concurrent runs of the same source (the SSE endpoint does no in-flight
+    # dedupe, and an SSE run can race a buffered one); the key prefix is
+    # only for debuggability. The leading dot keeps it out of the download
+    # routes' hex-name space.
+    return f".{key}.{uuid.uuid4().hex}.part.mp3"
 
 
-@app.get("/", response_class=HTMLResponse)
-async def index() -> str:
-    return _build_index_html()
+def _publish_audio(result: Dict[str, str], key: str) -> None:
+    """Move the per-run MP3 onto its content-addressed name.
 
+    Web conversions encode to their own scratch file, so the rename is
+    atomic and cannot race another conversion's encoder. The copy branch
+    covers results that still point at the shared final_podcast.mp3.
+    """
+    audio_path = Path(result.get("final_audio_path", str(OUTPUT_PATH)))
+    content_path = OUTPUT_PATH.parent / f"{key}.mp3"
+    if audio_path.name.startswith("."):
+        os.replace(audio_path, content_path)
+    else:
+        tmp_path = content_path.with_suffix(".tmp")
+        shutil.copyfile(audio_path, tmp_path)
+        os.replace(tmp_path, content_path)
+    # Drop any cached 404 so the fresh file is downloadable immediately.
+    _STAT_CACHE.pop(str(content_path), None)
 
-@app.post("/api/convert", response_class=JSONResponse)
-async def convert(request: ConvertRequest) -> JSONResponse:
-    source = request.url or request.text
+
+async def _acquire_pipeline_slot() -> None:
+    try:
+        async with asyncio.timeout(PIPELINE_ACQUIRE_TIMEOUT):
+            await PIPELINE_SEM.acquire()
+    except TimeoutError:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many conversions in progress. Please retry shortly.",
+        )
+
+
+# No response_model and a plain Response annotation: returning a prebuilt
+# ORJSONResponse means FastAPI passes it through without field validation or
+# a second serialization pass.
+@app.post("/api/convert")
+async def convert(request: ConvertRequest) -> Response:
+    source = request.source
     if not source:
         raise HTTPException(status_code=400, detail="Provide a URL or raw text.")
+    key = _source_key(source)
+
+    cached = _RESULTS.get(key)
+    if cached is not None:
+        _RESULTS.move_to_end(key)
+        return _convert_response(cached, key)
+
+    existing = _INFLIGHT.get(key)
+    if existing is not None:
+        try:
+            result = await asyncio.shield(existing)
+        except asyncio.CancelledError:
+            if existing.cancelled():
+                # The originating request disconnected before finishing;
+                # its run is gone, so ask the client to resubmit.
+                raise HTTPException(
+                    status_code=503,
+                    detail="The conversion was interrupted. Please retry.",
+                )
+            raise  # this waiter itself was cancelled
+        except Exception as exc:  # pragma: no cover - surfaced via HTTP
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+        return _convert_response(result, key)
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future = loop.create_future()
+    _INFLIGHT[key] = future
+
+    try:
+        await _acquire_pipeline_slot()
+    except HTTPException:
+        _INFLIGHT.pop(key, None)
+        future.cancel()
+        raise
 
     try:
-        result = await run_in_threadpool(pipeline.run, blog_source=source)
+        result = await loop.run_in_executor(
+            EXECUTOR, _run_pipeline, source, _scratch_name(key)
+        )
+        future.set_result(result)
     except Exception as exc:  # pragma: no cover - surfaced via HTTP
+        future.set_exception(exc)
+        future.exception()  # mark retrieved in case nobody is waiting
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+    finally:
+        PIPELINE_SEM.release()
+        _INFLIGHT.pop(key, None)
+        if not future.done():
+            # CancelledError (client disconnect) is a BaseException and
+            # skips the handler above; cancel the shared future so
+            # duplicate requests parked on it wake up instead of hanging.
+            future.cancel()
 
-    timestamp = int(time.time())
-    return JSONResponse(
-        {
-            "script": result.get("podcast_script", ""),
-            "audio_url": f"/download/final?ts={timestamp}",
-        }
+    _publish_audio(result, key)
+    _RESULTS[key] = result
+    while len(_RESULTS) > _RESULTS_MAX:
+        _RESULTS.popitem(last=False)
+    return _convert_response(result, key)
+
+
+# In-process job registry for conversions too long to hold an HTTP
+# connection open. The API shape matches a broker-backed queue (submit ->
+# 202 + job id -> poll), so clients would not change if the backing store
+# ever became Redis; for this single-host tool a broker would only add an
+# external service to deploy. Job ids are the source content hash, which
+# dedupes repeated submissions for free.
+_JOB_STATE: Dict[str, str] = {}
+_JOB_ERRORS: "OrderedDict[str, str]" = OrderedDict()
+_JOB_ERRORS_MAX = 64
+# The event loop only holds weak references to tasks; without an anchor a
+# job still queued on the semaphore can be garbage-collected and silently
+# never run.
+_JOB_TASKS: set = set()
+
+
+async def _run_job(key: str, source: str, future: asyncio.Future) -> None:
+    loop = asyncio.get_running_loop()
+    try:
+        # Jobs share the interactive gate but wait for a slot instead of
+        # failing fast with 429: queueing is the whole point of 202.
+        await PIPELINE_SEM.acquire()
+        _JOB_STATE[key] = "running"
+        try:
+            result = await loop.run_in_executor(
+                EXECUTOR, _run_pipeline, source, _scratch_name(key)
+            )
+        finally:
+            PIPELINE_SEM.release()
+        future.set_result(result)
+        _publish_audio(result, key)
+        _RESULTS[key] = result
+        while len(_RESULTS) > _RESULTS_MAX:
+            _RESULTS.popitem(last=False)
+    except Exception as exc:
+        _JOB_ERRORS[key] = str(exc)
+        while len(_JOB_ERRORS) > _JOB_ERRORS_MAX:
+            _JOB_ERRORS.popitem(last=False)
+        future.set_exception(exc)
+        future.exception()  # mark retrieved; pollers read _JOB_ERRORS
+    finally:
+        _INFLIGHT.pop(key, None)
+        _JOB_STATE.pop(key, None)
+        if not future.done():
+            # Task cancellation (shutdown) bypasses except Exception; wake
+            # any synchronous requests sharing this future.
+            future.cancel()
+
+
+@app.post("/api/convert/async", status_code=202)
+async def convert_async(request: ConvertRequest) -> Response:
+    source = request.source
+    if not source:
+        raise HTTPException(status_code=400, detail="Provide a URL or raw text.")
+    key = _source_key(source)
+    accepted = ORJSONResponse(
+        {"job_id": key, "status_url": f"/api/jobs/{key}"},
+        status_code=202,
     )
+    if key in _RESULTS or key in _INFLIGHT:
+        # Finished or already underway; the status endpoint has the answer.
+        return accepted
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = future
+    _JOB_STATE[key] = "queued"
+    _JOB_ERRORS.pop(key, None)  # resubmitting retries a failed job
+    task = asyncio.create_task(_run_job(key, source, future))
+    _JOB_TASKS.add(task)
+    task.add_done_callback(_JOB_TASKS.discard)
+    return accepted
+
+
+@app.get("/api/jobs/{job_id}")
+async def job_status(job_id: str) -> Response:
+    result = _RESULTS.get(job_id)
+    if result is not None:
+        _RESULTS.move_to_end(job_id)
+        return ORJSONResponse(
+            {
+                "status": "done",
+                "script": result.get("podcast_script", ""),
+                "audio_url": f"/download/{job_id}.mp3",
+            }
+        )
+    state = _JOB_STATE.get(job_id)
+    if state is None and job_id in _INFLIGHT:
+        state = "running"  # a synchronous conversion for the same source
+    if state is not None:
+        return ORJSONResponse({"status": state})
+    error = _JOB_ERRORS.get(job_id)
+    if error is not None:
+        return ORJSONResponse({"status": "error", "detail": error})
+    raise HTTPException(status_code=404, detail="Unknown job.")
+
+
+# How long a producer thread waits for queue space before re-checking
+# whether the consumer is still there.
+_PRODUCER_PUT_TIMEOUT = 1.0
+
+
+def _threadsafe_put(
+    loop: asyncio.AbstractEventLoop,
+    queue: asyncio.Queue,
+    stopped: threading.Event,
+    item: object,
+) -> bool:
+    """Put onto the handoff queue from a producer thread.
 
+    Returns False once the consumer has signalled shutdown (client
+    disconnect), so the producer can stop instead of blocking forever on a
+    full queue that nobody drains.
+    """
+    while not stopped.is_set():
+        try:
+            asyncio.run_coroutine_threadsafe(
+                asyncio.wait_for(queue.put(item), _PRODUCER_PUT_TIMEOUT), loop
+            ).result()
+            return True
+        except TimeoutError:
+            continue
+    return False
 
-@app.get("/download/final")
-async def download_final() -> FileResponse:
-    if not OUTPUT_PATH.exists():
+
+@app.post("/api/convert/stream")
+async def convert_stream(request: ConvertRequest) -> StreamingResponse:
+    source = request.source
+    if not source:
+        raise HTTPException(status_code=400, detail="Provide a URL or raw text.")
+
+    await _acquire_pipeline_slot()
+    loop = asyncio.get_running_loop()
+    # Bounded handoff between the producer thread running the pipeline and
+    # the async response, so a slow client cannot buffer unbounded audio.
+    queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+    done = object()
+    stopped = threading.Event()
+
+    def _produce() -> None:
+        try:
+            for chunk in _local_pipeline().iter_audio(blog_source=source):
+                if not _threadsafe_put(loop, queue, stopped, chunk):
+                    return
+            _threadsafe_put(loop, queue, stopped, done)
+        except Exception as exc:  # re-raised on the consumer side
+            _threadsafe_put(loop, queue, stopped, exc)
+
+    async def _consume():
+        threading.Thread(target=_produce, daemon=True).start()
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Tell the producer the response is gone before giving the
+            # slot back, so it stops instead of leaking.
+            stopped.set()
+            PIPELINE_SEM.release()
+
+    return StreamingResponse(
+        _consume(),
+        media_type="audio/mpeg",
+        headers={"Cache-Control": "no-store"},
+    )
+
+
+def _sse_event(name: str, data: str) -> bytes:
+    # SSE frames carry one "data:" line per payload line; a blank line
+    # terminates the event.
+    payload = "".join(f"data: {line}\n" for line in data.split("\n"))
+    return f"event: {name}\n{payload}\n".encode("utf-8")
+
+
+@app.post("/api/convert/sse")
+async def convert_sse(request: ConvertRequest) -> StreamingResponse:
+    """Server-sent events: script paragraphs as they stream, then audio.
+
+    The browser sees the first script text within a couple of seconds
+    instead of staring at a spinner for the whole pipeline run.
+    """
+    source = request.source
+    if not source:
+        raise HTTPException(status_code=400, detail="Provide a URL or raw text.")
+    key = _source_key(source)
+
+    await _acquire_pipeline_slot()
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+    done = object()
+    stopped = threading.Event()
+
+    def _produce() -> None:
+        try:
+            for event in _local_pipeline().iter_events(
+                blog_source=source,
+                output_path=OUTPUT_PATH.parent / _scratch_name(key),
+            ):
+                if not _threadsafe_put(loop, queue, stopped, event):
+                    return
+            _threadsafe_put(loop, queue, stopped, done)
+        except Exception as exc:  # surfaced as an SSE error event
+            _threadsafe_put(loop, queue, stopped, exc)
+
+    async def _consume():
+        threading.Thread(target=_produce, daemon=True).start()
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    yield _sse_event("error", str(item))
+                    break
+                name, data = item
+                if name == "audio":
+                    _publish_audio(data, key)
+                    yield _sse_event("audio", f"/download/{key}.mp3")
+                else:
+                    yield _sse_event("script", data)
+        finally:
+            # Tell the producer the response is gone before giving the
+            # slot back, so it stops instead of leaking.
+            stopped.set()
+            PIPELINE_SEM.release()
+
+    return StreamingResponse(
+        _consume(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
+
+
+_DOWNLOAD_CHUNK = 1024 * 1024
+_RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)")
+# When set (e.g. "/_protected_output"), downloads return an internal-redirect
+# header instead of the body and the front proxy serves the file itself with
+# sendfile(), e.g. nginx:
+#   location /_protected_output/ { internal; alias .../output/; sendfile on; }
+_ACCEL_PREFIX = os.getenv("DOWNLOAD_ACCEL_PREFIX", "")
+
+
+# Download traffic hammers the same one or two files, so a short-TTL stat
+# cache turns the per-request filesystem round-trip into a dict lookup. One
+# second is indistinguishable from fresh for browsers, and the cache stores
+# misses too so probing for absent files is equally cheap.
+_STAT_TTL = 1.0
+_STAT_CACHE: Dict[str, tuple] = {}
+_STAT_CACHE_MAX = 1024
+
+
+def _stat_cached(path: Path) -> Optional[os.stat_result]:
+    key = str(path)
+    now = time.monotonic()
+    entry = _STAT_CACHE.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    try:
+        stat: Optional[os.stat_result] = path.stat()
+    except FileNotFoundError:
+        stat = None
+    if len(_STAT_CACHE) >= _STAT_CACHE_MAX:
+        _STAT_CACHE.clear()
+    _STAT_CACHE[key] = (now + _STAT_TTL, stat)
+    return stat
+
+
+def _file_etag(stat: os.stat_result) -> str:
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def _parse_range(header: str, size: int) -> Optional[tuple]:
+    match = _RANGE_RE.fullmatch(header.strip())
+    if not match:
+        return None
+    start_s, end_s = match.groups()
+    if start_s:
+        start = int(start_s)
+        end = int(end_s) if end_s else size - 1
+    elif end_s:
+        start = max(size - int(end_s), 0)
+        end = size - 1
+    else:
+        return None
+    if start > end or start >= size:
+        return None
+    return start, min(end, size - 1)
+
+
+def _iter_file_range(path: Path, start: int, length: int):
+    # A sync generator: Starlette iterates it in the threadpool, reading
+    # 1 MiB chunks so a multi-MB episode never sits in memory at once.
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = handle.read(min(_DOWNLOAD_CHUNK, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _serve_file(request: Request, path: Path, filename: str) -> Response:
+    stat = _stat_cached(path)
+    if stat is None:
         raise HTTPException(
             status_code=404,
             detail="No podcast has been generated yet. Run a conversion first.",
         )
-    return FileResponse(
-        OUTPUT_PATH,
-        filename="final_podcast.mp3",
+    etag = _file_etag(stat)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    if request.method == "HEAD":
+        # Audio players probe with HEAD before streaming; answer from the
+        # cached stat without ever opening the file.
+        return Response(
+            media_type="audio/mpeg",
+            headers={**headers, "Content-Length": str(stat.st_size)},
+        )
+
+    if _ACCEL_PREFIX:
+        # The kernel moves the bytes, not this worker; the proxy also takes
+        # over Range handling for the redirected request.
+        return Response(
+            media_type="audio/mpeg",
+            headers={
+                **headers,
+                "X-Accel-Redirect": f"{_ACCEL_PREFIX.rstrip('/')}/{path.name}",
+            },
+        )
+
+    range_header = request.headers.get("range")
+    if range_header:
+        byte_range = _parse_range(range_header, stat.st_size)
+        if byte_range is None:
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{stat.st_size}"},
+            )
+        start, end = byte_range
+        length = end - start + 1
+        return StreamingResponse(
+            _iter_file_range(path, start, length),
+            status_code=206,
+            media_type="audio/mpeg",
+            headers={
+                **headers,
+                "Content-Range": f"bytes {start}-{end}/{stat.st_size}",
+                "Content-Length": str(length),
+            },
+        )
+
+    return StreamingResponse(
+        _iter_file_range(path, 0, stat.st_size),
         media_type="audio/mpeg",
+        headers={**headers, "Content-Length": str(stat.st_size)},
+    )
+
+
+@app.api_route("/download/final", methods=["GET", "HEAD"])
+async def download_final(request: Request) -> Response:
+    return _serve_file(request, OUTPUT_PATH, "final_podcast.mp3")
+
+
+_CONTENT_NAME_RE = re.compile(r"[0-9a-f]{16,64}")
+
+
+@app.api_route("/download/{name}.mp3", methods=["GET", "HEAD"])
+async def download_content(name: str, request: Request) -> Response:
+    if not _CONTENT_NAME_RE.fullmatch(name):
+        raise HTTPException(status_code=404, detail="Unknown audio file.")
+    response = _serve_file(request, OUTPUT_PATH.parent / f"{name}.mp3", f"{name}.mp3")
+    # Content-addressed names never change meaning, so clients and CDNs may
+    # cache them forever.
+    response.headers["Cache-Control"] = "public, immutable, max-age=31536000"
+    return response
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    try:
+        import uvloop  # noqa: F401
+
+        loop_impl = "uvloop"
+    except ImportError:  # uvloop does not support Windows
+        loop_impl = "auto"
+    # uvloop + httptools roughly double throughput over the selector loop and
+    # the pure-Python HTTP parser; both ship with uvicorn[standard].
+    uvicorn.run(
+        "blog_to_podcast.web.app:app",
+        host="0.0.0.0",
+        port=int(os.getenv("WEB_PORT", "8000")),
+        loop=loop_impl,
+        http="httptools",
+        # One web process: CPU parallelism comes from the pipeline's
+        # ProcessPoolExecutor, and the dedupe/result/job registries live in
+        # process memory — extra uvicorn workers would multiply the pool
+        # (cpu_count^2 pipeline processes) and split that state so job
+        # polling and dedupe break across workers.
+        workers=int(os.getenv("WEB_WORKERS", "1")),
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
     )
 
 